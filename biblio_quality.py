@@ -1,22 +1,132 @@
 import argparse
+import contextlib
+import functools
+import itertools
 import json
+import math
+import os
+import re
 import sys
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Iterable, Iterator, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: streaming parser for large JSON arrays
+    ijson = None
+
+try:
+    import xlsxwriter
+except ImportError:  # optional: streaming Excel writer, openpyxl is used otherwise
+    xlsxwriter = None
+
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:  # optional: Arrow-backed strings and Parquet/Feather reports
+    STRING_DTYPE = pd.StringDtype("python")
+
 
 CATEGORY_ASTAR = "A*"
 CATEGORY_RINC = "РИНЦ"
 CATEGORY_GREY = "Серая зона"
 CATEGORY_UNKNOWN = "Неизвестно"
+CATEGORIES = [CATEGORY_ASTAR, CATEGORY_RINC, CATEGORY_GREY, CATEGORY_UNKNOWN]
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+CATEGORY_DTYPE = pd.CategoricalDtype(categories=CATEGORIES)
+
+REPORT_FORMATS = ["xlsx", "parquet", "feather"]
+EXCEL_BATCH_ROWS = 10_000
+# worksheet size limits of the xlsx format; xlsxwriter silently skips cells beyond them
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_COLUMNS = 16_384
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+JSON_LINES_CHUNKSIZE = 100_000
+# smaller JSON files are parsed in one go, the streaming parser only pays off on large arrays
+JSON_STREAM_MIN_BYTES = 1 << 20
+
+# up to this many distinct (source, url, rank) keys classify_frame classifies them one by one
+ROW_MODE_MAX_KEYS = 1_000
+
+# below this size process start-up and pickling cost more than classification itself
+PARALLEL_MIN_ROWS = 50_000
+
+SOURCE_KEYS = ["Source", "source", "Journal", "journal", "Publisher", "publisher", "Venue", "venue"]
+URL_KEYS = ["URL", "url", "Link", "link", "Href", "href"]
+RANK_KEYS = ["journal_rank", "rank", "quartile", "scopus_quartile", "wos_quartile", "sjr_rank", "snip_rank"]
+
+RINC_MARKERS = frozenset({
+    "rinc", "ринц", "elibrary", "e-library", "elibrary.ru", "e-library.ru", "cyberleninka", "cyberleninka.ru"
+})
+GREY_MARKERS = frozenset({
+    "habr", "medium", "blog", "vc.ru", "substack", "teletype", "github.io", "dev.to", "t.me", "telegram",
+    "researchgate"  # typically not peer-reviewed
+})
+PREPRINT_MARKERS = frozenset({
+    "arxiv", "biorxiv", "bioarxiv", "medrxiv", "chemrxiv", "preprint"
+})
+ASTAR_RANKS = frozenset({"q1", "q2", "a*", "a"})
+
+# the minus sign, en and em dashes that office software substitutes for "-" count as the same separator
+QUARTILE_SEPARATOR = "[- −–—]"
+# unify similar encodings in one pass: "а*" (Cyrillic 'a') -> "a*", "q-1"/"q 1" -> "q1", "q-2"/"q 2" -> "q2"
+RANK_RE = re.compile(rf"а\*|q{QUARTILE_SEPARATOR}([12])")
+# raw (stripped, lowercased) ranks that normalize_rank maps onto ASTAR_RANKS, for matching whole columns at once;
+# anchored and grouped explicitly: str.fullmatch on Arrow strings in pandas 2.2 wraps the pattern
+# in ^...$ without a group, which anchors only the first and the last alternative
+ASTAR_RANK_PATTERN = rf"^(?:q{QUARTILE_SEPARATOR}?[12]|[aа]\*|a)$"
+
+# netloc part of an absolute ("scheme://host") or scheme-relative ("//host") URL, as urlparse sees it
+NETLOC_PATTERN = r"^(?:[A-Za-z][A-Za-z0-9+.\-]*:)?//([^/?#]*)"
+NETLOC_RE = re.compile(NETLOC_PATTERN)
+
+
+def markers_pattern(markers: Iterable[str]) -> str:
+    # sorted so that the pattern does not depend on frozenset iteration order
+    return "|".join(map(re.escape, sorted(markers)))
+
+
+RINC_RE = re.compile(markers_pattern(RINC_MARKERS))
+GREY_RE = re.compile(markers_pattern(GREY_MARKERS))
+PREPRINT_RE = re.compile(markers_pattern(PREPRINT_MARKERS))
+
+# marker groups in priority order
+MARKER_GROUPS = (("rinc", RINC_RE), ("grey", GREY_RE), ("preprint", PREPRINT_RE))
+
+
+def marker_group(text_blob: str) -> Optional[str]:
+    # One precompiled alternation search per group, highest priority first. This measured faster than
+    # a single combined pattern or an Aho-Corasick pass: re.search skips ahead on the markers' literal text
+    for tag, regex in MARKER_GROUPS:
+        if regex.search(text_blob):
+            return tag
+    return None
+
+
+def loads_json(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN literals, lone surrogates), let the stdlib parser decide
+            pass
+    return json.loads(raw)
 
 
 def read_json_file(file_path: str) -> Any:
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return loads_json(f.read())
     except FileNotFoundError as e:
         raise SystemExit(f"Файл не найден: {file_path}") from e
     except json.JSONDecodeError as e:
@@ -33,7 +143,93 @@ def load_bibliography(file_path: str) -> pd.DataFrame:
                 break
     if not isinstance(data, list):
         raise SystemExit("Ожидался JSON-массив записей или объект с массивом по ключу 'items/records'.")
-    return pd.DataFrame(data)
+    return normalize_text_columns(pd.DataFrame(data))
+
+
+def clean_text_cell(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    return None if value in ("", "-") else value
+
+
+def normalize_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Text values are stripped once and the "-" placeholder / blank values become missing, cell by cell,
+    # so the result does not depend on what else a column holds; purely textual columns also get
+    # a string dtype instead of generic objects
+    for col in df.columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+            values = df[col].astype(STRING_DTYPE).str.strip()
+            df[col] = values.mask(values.isin(["", "-"]))
+        elif df[col].dtype == object:
+            df[col] = df[col].map(clean_text_cell)
+    return df
+
+
+def iter_bibliography(file_path: str, chunksize: int = JSON_LINES_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    if file_path.lower().endswith(JSON_LINES_SUFFIXES):
+        yield from iter_json_lines(file_path, chunksize)
+    elif ijson is not None and is_large_json_array(file_path):
+        yield from iter_json_array(file_path, chunksize)
+    else:
+        yield load_bibliography(file_path)
+
+
+def iter_json_lines(file_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    # JSON Lines: parse a bounded number of records at a time instead of the whole file,
+    # line by line with the same parser as read_json_file
+    try:
+        f = open(file_path, "rb")
+    except FileNotFoundError as e:
+        raise SystemExit(f"Файл не найден: {file_path}") from e
+    with f:
+        for first_line_no in itertools.count(1, chunksize):
+            lines = list(itertools.islice(f, chunksize))
+            if not lines:
+                break
+            records = []
+            for line_no, line in enumerate(lines, first_line_no):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(loads_json(line))
+                except json.JSONDecodeError as e:
+                    raise SystemExit(f"Некорректный JSON в '{file_path}', строка {line_no}: {e}") from e
+            if records:
+                yield normalize_text_columns(pd.DataFrame(records))
+
+
+def is_large_json_array(file_path: str) -> bool:
+    # Only a top-level array is streamed: for an object the container key can only be chosen
+    # after the whole object has been seen
+    try:
+        if os.path.getsize(file_path) < JSON_STREAM_MIN_BYTES:
+            return False
+        with open(file_path, "rb") as f:
+            head = f.read(4096).lstrip(b" \t\r\n\xef\xbb\xbf")
+    except OSError:
+        return False
+    return head.startswith(b"[")
+
+
+class JsonStreamError(Exception):
+    # ijson rejected input that the regular parser may still accept (NaN/Infinity literals)
+    pass
+
+
+def iter_json_array(file_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    # Top-level JSON array: build one frame per batch of records so the whole list of dicts
+    # never has to be in memory at once
+    with open(file_path, "rb") as f:
+        records = ijson.items(f, "item", use_float=True)
+        while True:
+            try:
+                batch = list(itertools.islice(records, chunksize))
+            except ijson.JSONError as e:
+                raise JsonStreamError(str(e)) from e
+            if not batch:
+                break
+            yield normalize_text_columns(pd.DataFrame(batch))
 
 
 def get_first_present(row: pd.Series, candidates: List[str]) -> str:
@@ -45,78 +241,186 @@ def get_first_present(row: pd.Series, candidates: List[str]) -> str:
     return ""
 
 
+@functools.lru_cache(maxsize=65536)
 def extract_domain(url: str) -> str:
-    try:
-        parsed = urlparse(url)
-        host = parsed.netloc.lower()
-        return host.replace("www.", "")
-    except Exception:
+    # bibliographies cite the same hosts over and over, so each distinct URL is parsed once
+    match = NETLOC_RE.match(url or "")
+    if not match:
         return ""
+    return match.group(1).lower().replace("www.", "")
+
+
+def extract_domains(urls: pd.Series) -> pd.Series:
+    # Column-wise extract_domain: one regex sweep over the whole column instead of a call per URL
+    hosts = urls.str.extract(NETLOC_PATTERN, expand=False).fillna("")
+    return hosts.str.lower().str.replace("www.", "", regex=False)
+
 
+def rank_replacement(match: "re.Match[str]") -> str:
+    quartile = match.group(1)
+    return f"q{quartile}" if quartile else "a*"
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize_rank(rank_raw: str) -> str:
     rank = (rank_raw or "").strip().lower()
-    # unify similar encodings
-    replacements = {
-        "а*": "a*",  # Cyrillic 'a' to Latin
-        "q-1": "q1",
-        "q-2": "q2",
-        "q 1": "q1",
-        "q 2": "q2",
-    }
-    for src, dst in replacements.items():
-        rank = rank.replace(src, dst)
-    return rank
+    return RANK_RE.sub(rank_replacement, rank)
 
 
 def classify_row(row: pd.Series, treat_preprints_as_grey: bool = True) -> str:
-    source = get_first_present(row, [
-        "Source", "source", "Journal", "journal", "Publisher", "publisher", "Venue", "venue",
-    ]).lower()
-    url = get_first_present(row, ["URL", "url", "Link", "link", "Href", "href"])
+    return classify_values(
+        get_first_present(row, SOURCE_KEYS),
+        get_first_present(row, URL_KEYS),
+        get_first_present(row, RANK_KEYS),
+        treat_preprints_as_grey=treat_preprints_as_grey,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_values(source: str, url: str, rank_text: str, treat_preprints_as_grey: bool = True) -> str:
+    # Classification of already extracted field values; no pandas row is needed.
+    # Cached: records from the same venue repeat the same (source, url, rank) values
+    source = source.lower()
     domain = extract_domain(url)
-    rank = normalize_rank(get_first_present(row, [
-        "journal_rank", "rank", "quartile", "scopus_quartile", "wos_quartile", "sjr_rank", "snip_rank"
-    ]))
+    rank = normalize_rank(rank_text)
+
+    # source and domain are already lowercase; markers contain no spaces, so empty parts
+    # need not be filtered out (same layout as the blob in classify_codes)
+    text_blob = f"{source} {domain} {url.lower()}"
 
-    text_blob = " ".join(filter(None, [source, domain, url])).lower()
+    group = marker_group(text_blob)
 
     # RINC detection
-    rinc_markers = (
-        "rinc", "ринц", "elibrary", "e-library", "elibrary.ru", "e-library.ru", "cyberleninka", "cyberleninka.ru"
-    )
-    if any(marker in text_blob for marker in rinc_markers):
+    if group == "rinc":
         return CATEGORY_RINC
 
     # Grey zone detection
-    grey_markers = (
-        "habr", "medium", "blog", "vc.ru", "substack", "teletype", "github.io", "dev.to", "t.me", "telegram",
-        "researchgate"  # typically not peer-reviewed
-    )
-
-    # Preprint detection (optional as grey)
-    preprint_markers = (
-        "arxiv", "biorxiv", "bioarxiv", "medrxiv", "chemrxiv", "preprint"
-    )
-
-    if any(marker in text_blob for marker in grey_markers):
+    if group == "grey":
         return CATEGORY_GREY
 
-    if treat_preprints_as_grey and any(marker in text_blob for marker in preprint_markers):
+    # Preprint detection (optional as grey)
+    if treat_preprints_as_grey and group == "preprint":
         return CATEGORY_GREY
 
     # A* via quartiles/ranks
-    if rank in {"q1", "q2", "a*", "a"}:
+    if rank in ASTAR_RANKS:
         return CATEGORY_ASTAR
 
     return CATEGORY_UNKNOWN
 
 
+def coalesce_columns(df: pd.DataFrame, candidates: List[str]) -> pd.Series:
+    # Column-wise get_first_present: first non-empty, non-"-" value among the candidate columns
+    result: Optional[pd.Series] = None
+    # fill column by column: bfill(axis=1) over extension dtypes goes through a slow row-wise path
+    for key in candidates:
+        if key not in df.columns:
+            continue
+        values = df[key]
+        if values.dtype != STRING_DTYPE:
+            # text columns were already cleaned up by normalize_text_columns, mixed ones were not
+            values = values.astype(STRING_DTYPE).str.strip()
+            values = values.mask(values.isin(["", "-"]))
+        result = values if result is None else result.fillna(values)
+        if not result.hasnans:
+            # every row already has a value, lower-priority candidates cannot change anything
+            break
+    if result is None:
+        return pd.Series("", index=df.index, dtype=STRING_DTYPE)
+    return result.fillna("")
+
+
+def classify_codes(
+    source: pd.Series, url: pd.Series, rank: pd.Series, treat_preprints_as_grey: bool = True
+) -> np.ndarray:
+    # Column-wise counterpart of classify_row over lowercased source/URL/rank columns, returns int8 category codes;
+    # every marker group is a single regex pass over the column
+    domain = extract_domains(url)
+
+    text_blob = source + " " + domain + " " + url
+
+    # One str.contains per marker group rather than a single str.extract of a combined pattern:
+    # on Arrow strings contains runs as a native regex kernel, while extract falls back to Python
+    is_rinc, is_grey, is_preprint = (
+        text_blob.str.contains(regex.pattern, regex=True, na=False).to_numpy(dtype=bool)
+        for _, regex in MARKER_GROUPS
+    )
+    is_astar = rank.str.contains(ASTAR_RANK_PATTERN, regex=True, na=False).to_numpy(dtype=bool)
+
+    # select int8 category codes directly instead of strings that pd.Categorical would have to hash back
+    return np.select(
+        [is_rinc, is_grey, is_preprint & treat_preprints_as_grey, is_astar],
+        [CATEGORY_CODES[CATEGORY_RINC], CATEGORY_CODES[CATEGORY_GREY], CATEGORY_CODES[CATEGORY_GREY],
+         CATEGORY_CODES[CATEGORY_ASTAR]],
+        default=CATEGORY_CODES[CATEGORY_UNKNOWN],
+    ).astype(np.int8)
+
+
+def classify_frame(df: pd.DataFrame, treat_preprints_as_grey: bool = True) -> pd.Series:
+    # coalesce_columns already strips the values; the URL is lowercased once and the domain is cut out of it
+    keys = pd.DataFrame({
+        "source": coalesce_columns(df, SOURCE_KEYS).str.lower(),
+        "url": coalesce_columns(df, URL_KEYS).str.lower(),
+        "rank": coalesce_columns(df, RANK_KEYS).str.lower(),
+    }, index=df.index)
+    # bibliographies cite the same venues over and over: classify each distinct (source, url, rank) once
+    # and broadcast back; ngroup(sort=False) numbers the keys in the order drop_duplicates keeps them
+    row_keys = keys.groupby(list(keys.columns), sort=False).ngroup().to_numpy()
+    unique_keys = keys.drop_duplicates()
+    if len(unique_keys) <= ROW_MODE_MAX_KEYS:
+        # with few distinct keys the fixed cost of every column operation dominates, the cached scalar path is cheaper
+        unique_codes = np.fromiter(
+            (
+                CATEGORY_CODES[classify_values(source, url, rank, treat_preprints_as_grey=treat_preprints_as_grey)]
+                for source, url, rank in unique_keys.itertuples(index=False, name=None)
+            ),
+            dtype=np.int8,
+            count=len(unique_keys),
+        )
+    else:
+        unique_codes = classify_codes(
+            unique_keys["source"], unique_keys["url"], unique_keys["rank"], treat_preprints_as_grey=treat_preprints_as_grey
+        )
+    return pd.Series(pd.Categorical.from_codes(unique_codes[row_keys], dtype=CATEGORY_DTYPE), index=df.index)
+
+
+def classify_frame_parallel(
+    df: pd.DataFrame, treat_preprints_as_grey: bool = True, executor: Optional[ProcessPoolExecutor] = None,
+    jobs: int = 1,
+) -> pd.Series:
+    # executor is a pool of `jobs` worker processes owned by the caller, so consecutive chunks reuse the same workers
+    if executor is None or jobs < 2 or len(df) <= PARALLEL_MIN_ROWS:
+        return classify_frame(df, treat_preprints_as_grey=treat_preprints_as_grey)
+    # workers only need the candidate columns, which keeps the pickled chunks small
+    columns = [key for key in SOURCE_KEYS + URL_KEYS + RANK_KEYS if key in df.columns]
+    bounds = np.linspace(0, len(df), jobs + 1, dtype=int)
+    chunks = [df.iloc[start:stop][columns] for start, stop in zip(bounds[:-1], bounds[1:])]
+    classify = functools.partial(classify_frame, treat_preprints_as_grey=treat_preprints_as_grey)
+    return pd.concat(executor.map(classify, chunks))
+
+
+def count_categories(categories: pd.Series) -> Dict[str, int]:
+    if isinstance(categories.dtype, pd.CategoricalDtype):
+        # a single bincount pass over the integer codes; -1 marks missing values
+        codes = categories.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        counts = np.bincount(codes, minlength=len(categories.cat.categories))
+        # categories in order of first appearance, like value_counts, so that equal counts keep that order
+        return {categories.cat.categories[code]: int(counts[code]) for code in pd.unique(codes)}
+    return categories.value_counts().to_dict()
+
+
 def compute_stats(categories: pd.Series) -> Dict[str, float]:
-    if categories.empty:
+    return stats_from_counts(count_categories(categories))
+
+
+def stats_from_counts(counts: Dict[str, int]) -> Dict[str, float]:
+    counts_series = pd.Series(counts, dtype="int64")
+    # a categorical column also counts the categories that never occur
+    counts_series = counts_series[counts_series > 0].sort_values(ascending=False, kind="stable")
+    if counts_series.empty:
         return {}
-    percentages = (categories.value_counts(normalize=True) * 100).round(2)
-    return percentages.to_dict()
+    return (counts_series / counts_series.sum() * 100).round(2).to_dict()
 
 
 def print_report(stats: Dict[str, float], a_star_min: float, rinc_min: float, grey_max: float) -> None:
@@ -124,7 +428,7 @@ def print_report(stats: Dict[str, float], a_star_min: float, rinc_min: float, gr
     if not stats:
         print("— Нет данных для отчёта")
     else:
-        for cat, pct in stats.items():
+        for cat, pct in Counter(stats).most_common():
             print(f"— {cat}: {pct:.2f}%")
 
     a_star_pct = stats.get(CATEGORY_ASTAR, 0.0)
@@ -137,47 +441,166 @@ def print_report(stats: Dict[str, float], a_star_min: float, rinc_min: float, gr
     print(f"≤ {grey_max:.0f}% — {CATEGORY_GREY}: ", "OK" if grey_pct <= grey_max else "FAIL")
 
 
+def summary_frame(stats: Dict[str, float]) -> pd.DataFrame:
+    return (
+        pd.Series(stats, name="Процент")
+        .rename_axis("Категория")
+        .reset_index()
+    )
+
+
+def excel_cell(value: Any) -> Any:
+    # xlsxwriter only takes finite numbers and scalars; JSON arrays/objects (author lists etc.) and
+    # Infinity/-Infinity are written as text like to_excel does
+    if isinstance(value, float) and math.isinf(value):
+        return "inf" if value > 0 else "-inf"
+    return value if pd.api.types.is_scalar(value) else str(value)
+
+
+def write_sheet_rows(workbook: Any, sheet_name: str, df: pd.DataFrame) -> None:
+    # the header takes one row; to_excel refuses such sheets too instead of cutting them off
+    if len(df) + 1 > EXCEL_MAX_ROWS or len(df.columns) > EXCEL_MAX_COLUMNS:
+        raise ValueError(
+            f"лист '{sheet_name}' не помещается в Excel: {len(df) + 1} строк × {len(df.columns)} столбцов, "
+            f"допустимо не более {EXCEL_MAX_ROWS} × {EXCEL_MAX_COLUMNS}"
+        )
+    sheet = workbook.add_worksheet(sheet_name)
+    sheet.write_row(0, 0, [str(col) for col in df.columns])
+    # only generic object columns can hold nested JSON values, and only those and float columns infinities
+    object_positions = [
+        pos for pos, dtype in enumerate(df.dtypes) if dtype == object or pd.api.types.is_float_dtype(dtype)
+    ]
+    # in constant_memory mode only the current row is kept, so cells must be written strictly row by row;
+    # rows are boxed into Python objects one batch at a time to keep the writer's own footprint bounded too
+    for start in range(0, len(df), EXCEL_BATCH_ROWS):
+        batch = df.iloc[start:start + EXCEL_BATCH_ROWS]
+        values = batch.astype(object)
+        for pos in object_positions:
+            values.iloc[:, pos] = values.iloc[:, pos].map(excel_cell)
+        values = values.where(batch.notna(), None)
+        for row_idx, row in enumerate(values.itertuples(index=False, name=None), start=start + 1):
+            sheet.write_row(row_idx, 0, row)
+
+
 def write_excel(df: pd.DataFrame, stats: Dict[str, float], output_path: str) -> None:
     try:
-        with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False, sheet_name="Записи")
-            summary_df = (
-                pd.Series(stats, name="Процент")
-                .rename_axis("Категория")
-                .reset_index()
-            )
-            summary_df.to_excel(writer, index=False, sheet_name="Сводка")
+        if xlsxwriter is not None:
+            # rows are flushed to disk as they are written instead of building the whole workbook in memory
+            options = {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+            try:
+                with xlsxwriter.Workbook(output_path, options) as workbook:
+                    write_sheet_rows(workbook, "Записи", df)
+                    write_sheet_rows(workbook, "Сводка", summary_frame(stats))
+            except Exception:
+                # the workbook is still closed, i.e. saved, on the way out: do not leave a truncated report behind
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+                raise
+        else:
+            with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+                df.to_excel(writer, index=False, sheet_name="Записи")
+                summary_frame(stats).to_excel(writer, index=False, sheet_name="Сводка")
         print(f"\n💾 Подробный отчёт сохранён в '{output_path}'")
     except Exception as e:
         print(f"Не удалось записать Excel ('{output_path}'): {e}")
 
 
+def write_columnar(df: pd.DataFrame, stats: Dict[str, float], output_path: str, fmt: str) -> None:
+    # Parquet/Feather via pyarrow: the summary goes to a sibling "<name>_summary" file
+    root, ext = os.path.splitext(output_path)
+    summary_path = f"{root}_summary{ext}"
+    try:
+        # JSON fields may mix numbers and strings in one column, which Arrow cannot store as is
+        records = df.astype({col: STRING_DTYPE for col, dtype in df.dtypes.items() if dtype == object})
+        summary_df = summary_frame(stats)
+        if fmt == "parquet":
+            records.to_parquet(output_path, index=False, compression="zstd")
+            summary_df.to_parquet(summary_path, index=False, compression="zstd")
+        else:
+            records.reset_index(drop=True).to_feather(output_path)
+            summary_df.to_feather(summary_path)
+        print(f"\n💾 Подробный отчёт сохранён в '{output_path}', сводка — в '{summary_path}'")
+    except Exception as e:
+        print(f"Не удалось записать {fmt} ('{output_path}'): {e}")
+
+
+def write_report(df: pd.DataFrame, stats: Dict[str, float], output_path: str, fmt: str = "xlsx") -> None:
+    if fmt == "xlsx":
+        write_excel(df, stats, output_path)
+    else:
+        write_columnar(df, stats, output_path, fmt)
+
+
+def classify_chunks(
+    frames: Iterable[pd.DataFrame], treat_preprints_as_grey: bool, executor: Optional[ProcessPoolExecutor],
+    jobs: int, keep_records: bool,
+) -> Tuple[Counter, List[pd.DataFrame]]:
+    # category counts are accumulated per chunk; records are only kept when a report has to be written
+    counts: Counter = Counter()
+    chunks = []
+    for chunk in frames:
+        chunk["Категория"] = classify_frame_parallel(
+            chunk, treat_preprints_as_grey=treat_preprints_as_grey, executor=executor, jobs=jobs
+        )
+        counts.update(count_categories(chunk["Категория"]))
+        if keep_records:
+            chunks.append(chunk)
+    return counts, chunks
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"ожидалось целое число не меньше 1, получено {value}")
+    return number
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Оценка качества списка литературы (часть 3)")
     parser.add_argument("--input", required=True, help="Путь к JSON-файлу со списком литературы")
-    parser.add_argument("--output", default="bibliography_report.xlsx", help="Путь к Excel-отчёту (xlsx)")
+    parser.add_argument("--output", default="bibliography_report.xlsx", help="Путь к отчёту (по умолчанию xlsx)")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="xlsx",
+                        help="Формат отчёта: xlsx, parquet или feather (по умолчанию xlsx)")
     parser.add_argument("--a-star-min", type=float, default=50.0, help="Минимальный процент A* (по умолчанию 50)")
     parser.add_argument("--rinc-min", type=float, default=15.0, help="Минимальный процент РИНЦ (по умолчанию 15)")
     parser.add_argument("--grey-max", type=float, default=10.0, help="Максимальный процент Серой зоны (по умолчанию 10)")
     parser.add_argument("--treat-preprints-as-grey", action="store_true", help="Считать arXiv/препринты серой зоной")
+    parser.add_argument("--jobs", type=positive_int, default=None,
+                        help="Число процессов для классификации больших списков "
+                             "(по умолчанию — по числу ядер, 1 — без параллелизма)")
 
     args = parser.parse_args(argv)
 
-    df = load_bibliography(args.input)
-    if df.empty:
+    jobs = args.jobs or os.cpu_count() or 1
+    # one worker pool for the whole run instead of one per input chunk; workers start on first use,
+    # so inputs too small for parallel classification never spawn any
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext()
+    with pool as executor:
+        classify = functools.partial(
+            classify_chunks, treat_preprints_as_grey=args.treat_preprints_as_grey, executor=executor, jobs=jobs,
+            keep_records=bool(args.output),
+        )
+        try:
+            counts, chunks = classify(iter_bibliography(args.input))
+        except JsonStreamError:
+            # batches already classified are dropped and the whole file is parsed again the regular way
+            counts, chunks = classify([load_bibliography(args.input)])
+    if not sum(counts.values()):
         print("Входной список пуст.")
         return 0
 
-    df = df.copy()
-    df["Категория"] = df.apply(lambda row: classify_row(row, treat_preprints_as_grey=args.treat_preprints_as_grey), axis=1)
-    stats = compute_stats(df["Категория"]) or {}
+    stats = stats_from_counts(counts)
 
     print_report(stats, a_star_min=args["a_star_min"] if isinstance(args, dict) else args.a_star_min,
                  rinc_min=args["rinc_min"] if isinstance(args, dict) else args.rinc_min,
                  grey_max=args["grey_max"] if isinstance(args, dict) else args.grey_max)
 
     if args.output:
-        write_excel(df, stats, args.output)
+        output_path = args.output
+        if args.format != "xlsx" and output_path.endswith(".xlsx"):
+            output_path = f"{output_path[:-len('.xlsx')]}.{args.format}"
+        df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        write_report(df, stats, output_path, fmt=args.format)
 
     return 0
 
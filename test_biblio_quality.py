@@ -0,0 +1,137 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+import biblio_quality as bq
+
+
+# JSON records as they come from real exports: nested author lists/objects, mixed and missing values
+NESTED_RECORDS = [
+    {"Source": "Nature", "authors": ["A", "B"], "meta": {"doi": "10.1/x", "pages": [1, 2]}, "year": 2020,
+     "url": "https://nature.com/x", "score": float("inf")},
+    {"Source": "-", "authors": [], "meta": None, "year": None, "url": "https://habr.com/p", "score": 1.5},
+    {"Source": "arXiv", "authors": "solo", "meta": {}, "year": float("-inf"), "open_access": True},
+]
+
+
+# field values covering every marker group, URL shape and rank spelling, including near-misses of the A* ranks
+SOURCES = ["", "Nature", "eLibrary", "Вестник РИНЦ", "Habr", "arXiv preprint", "ResearchGate", "IEEE Transactions"]
+URLS = [
+    "", "https://www.nature.com/articles/x", "https://elibrary.ru/item.asp?id=1", "http://cyberleninka.ru/a",
+    "https://habr.com/ru/post/1", "https://arxiv.org/abs/1", "//t.me/chan", "ftp://example.org/blog",
+    "https://WWW.Medium.com/x", "not a url",
+]
+RANKS = ["", "Q1", "q-2", "Q−1", "q—2", "Q 1", "Q – 1", "Q3", "A*", "а*", "A", "n/a", "ba", "abdc a", "q1x", "xa*y", "B"]
+
+
+@pytest.mark.parametrize("treat_preprints_as_grey", [False, True])
+@pytest.mark.parametrize("storage", ["python", "pyarrow"])
+def test_classify_codes_matches_classify_values(storage, treat_preprints_as_grey):
+    # classify_frame picks the column-wise or the scalar classifier by the number of distinct keys,
+    # so both must agree on every string backend
+    if storage == "pyarrow":
+        pytest.importorskip("pyarrow")
+    keys = list(itertools.product(SOURCES, URLS, RANKS))
+    expected = [
+        bq.CATEGORY_CODES[bq.classify_values(source, url, rank, treat_preprints_as_grey=treat_preprints_as_grey)]
+        for source, url, rank in keys
+    ]
+    source, url, rank = (pd.Series(column, dtype=pd.StringDtype(storage)).str.lower() for column in zip(*keys))
+    got = bq.classify_codes(source, url, rank, treat_preprints_as_grey=treat_preprints_as_grey)
+    assert got.tolist() == expected
+
+
+def read_report(path):
+    return pd.read_excel(path, sheet_name=None)
+
+
+def test_xlsxwriter_report_matches_openpyxl(tmp_path, monkeypatch):
+    pytest.importorskip("xlsxwriter")
+    df = bq.normalize_text_columns(pd.DataFrame(NESTED_RECORDS))
+    df["Категория"] = bq.classify_frame(df)
+    stats = bq.compute_stats(df["Категория"])
+
+    bq.write_excel(df, stats, str(tmp_path / "xlsxwriter.xlsx"))
+    monkeypatch.setattr(bq, "xlsxwriter", None)
+    bq.write_excel(df, stats, str(tmp_path / "openpyxl.xlsx"))
+
+    expected = read_report(tmp_path / "openpyxl.xlsx")
+    got = read_report(tmp_path / "xlsxwriter.xlsx")
+    assert got.keys() == expected.keys()
+    for sheet_name in expected:
+        pd.testing.assert_frame_equal(got[sheet_name], expected[sheet_name])
+    assert got["Записи"]["authors"].tolist() == ["['A', 'B']", "[]", "solo"]
+    assert got["Записи"]["score"].tolist()[0] == float("inf")  # written as "inf", read back as a number
+
+
+def test_streamed_array_with_nan_literal_falls_back_to_regular_parser(tmp_path, monkeypatch, capsys):
+    pytest.importorskip("ijson")
+    # ijson rejects NaN, the regular parser (like the baseline json.load) accepts it
+    path = tmp_path / "biblio.json"
+    path.write_text('[{"Source": "eLibrary"}, {"Source": "Nature", "journal_rank": "Q1"}, {"score": NaN}]')
+    monkeypatch.setattr(bq, "JSON_STREAM_MIN_BYTES", 0)
+    frames = bq.iter_bibliography(str(path), chunksize=1)
+    assert len(next(frames)) == 1
+    with pytest.raises(bq.JsonStreamError):
+        list(frames)
+
+    assert bq.main(["--input", str(path), "--output", ""]) == 0
+    out = capsys.readouterr().out
+    assert "— РИНЦ: 33.33%" in out and "— A*: 33.33%" in out and "— Неизвестно: 33.33%" in out
+
+
+def test_xlsxwriter_report_too_large_for_a_sheet_fails(tmp_path, monkeypatch, capsys):
+    pytest.importorskip("xlsxwriter")
+    # header plus three records do not fit into three rows: report the failure instead of cutting rows off
+    monkeypatch.setattr(bq, "EXCEL_MAX_ROWS", 3)
+    df = bq.normalize_text_columns(pd.DataFrame(NESTED_RECORDS))
+    output_path = tmp_path / "report.xlsx"
+    bq.write_excel(df, {}, str(output_path))
+    assert "Не удалось записать Excel" in capsys.readouterr().out
+    assert not output_path.exists()
+
+
+def test_normalize_text_columns_cleans_text_cells_of_mixed_columns():
+    df = bq.normalize_text_columns(pd.DataFrame({
+        "Source": [" Nature ", "-", "", "eLibrary"],
+        "year": ["-", " 2019 ", 2020, "  "],
+        "authors": [["A"], "-", None, " B "],
+    }))
+    assert df["Source"].tolist()[::3] == ["Nature", "eLibrary"] and df["Source"].iloc[1:3].isna().all()
+    assert df["year"].tolist() == [None, "2019", 2020, None]
+    assert df["authors"].tolist() == [["A"], None, None, "B"]
+
+
+@pytest.mark.parametrize("file_name", ["biblio.json", "biblio.jsonl"])
+def test_streamed_chunks_match_whole_file(tmp_path, monkeypatch, file_name):
+    records = ['{"year": "-"}', '{"year": "-"}', '{"year": 2020, "Source": " Nature "}', '{"year": "-", "Source": "-"}']
+    path = tmp_path / file_name
+    if file_name.endswith(".jsonl"):
+        path.write_text("\n".join(records))
+        whole = bq.normalize_text_columns(pd.DataFrame([bq.loads_json(record) for record in records]))
+    else:
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(bq, "JSON_STREAM_MIN_BYTES", 0)
+        path.write_text("[" + ", ".join(records) + "]")
+        whole = bq.load_bibliography(str(path))
+    # cleanup must not depend on which records end up in the same chunk
+    streamed = pd.concat(list(bq.iter_bibliography(str(path), chunksize=2)), ignore_index=True)
+
+    def cells(df):
+        return df.astype(object).where(df.notna(), None).values.tolist()
+
+    assert cells(streamed[whole.columns]) == cells(whole)
+    assert cells(whole) == [[None, None], [None, None], [2020, "Nature"], [None, None]]
+
+
+def test_equal_counts_keep_first_appearance_order():
+    # like the baseline value_counts: ties are reported in the order the categories first occur
+    first = pd.DataFrame({"Source": ["Nature", "eLibrary"], "rank": ["Q2", None]})
+    second = pd.DataFrame({"Source": ["habr", "eLibrary", "Nature"], "rank": [None, None, "A"]})
+    assert list(bq.compute_stats(bq.classify_frame(first))) == [bq.CATEGORY_ASTAR, bq.CATEGORY_RINC]
+
+    counts, _ = bq.classify_chunks(
+        [first, second], treat_preprints_as_grey=False, executor=None, jobs=1, keep_records=False
+    )
+    assert list(bq.stats_from_counts(counts)) == [bq.CATEGORY_ASTAR, bq.CATEGORY_RINC, bq.CATEGORY_GREY]